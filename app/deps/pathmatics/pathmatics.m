@@ -103,6 +103,34 @@ void _curvelength(double x0, double y0, double x1, double y1,
     *out_length = length;
 }
 
+// curves are subdivided until their control polygon is within FLATNESS of the chord
+// (or MAX_DEPTH halvings have been made)
+#define FLATNESS 0.01
+#define MAX_DEPTH 10
+
+double _curvelength_adaptive(double x0, double y0, double x1, double y1,
+                             double x2, double y2, double x3, double y3, int depth)
+{
+    double chord, poly;
+    double x01, y01, x12, y12, x23, y23, x012, y012, x123, y123, xm, ym;
+
+    chord = hypot(x3-x0, y3-y0);
+    poly = hypot(x1-x0, y1-y0) + hypot(x2-x1, y2-y1) + hypot(x3-x2, y3-y2);
+    if (poly-chord < FLATNESS || depth >= MAX_DEPTH)
+        return (chord + poly) / 2;
+
+    // split at t=0.5 (de casteljau) and measure each half
+    x01 = (x0+x1)/2;     y01 = (y0+y1)/2;
+    x12 = (x1+x2)/2;     y12 = (y1+y2)/2;
+    x23 = (x2+x3)/2;     y23 = (y2+y3)/2;
+    x012 = (x01+x12)/2;  y012 = (y01+y12)/2;
+    x123 = (x12+x23)/2;  y123 = (y12+y23)/2;
+    xm = (x012+x123)/2;  ym = (y012+y123)/2;
+
+    return _curvelength_adaptive(x0, y0, x01, y01, x012, y012, xm, ym, depth+1)
+         + _curvelength_adaptive(xm, ym, x123, y123, x23, y23, x3, y3, depth+1);
+}
+
 static PyObject *
 cPathmatics_linepoint(PyObject *self, PyObject *args)
 {
@@ -538,6 +566,143 @@ cPathmatics_xor(PyObject *self, PyObject *args)
     return cPathmatics_operation(self, args, GPC_XOR);
 }
 
+// Converts an NSBezierPath to an immutable CGPath in a single pass over its elements.
+// Since we can't build a PyObjC proxy for the CGPathRef without linking against PyObjC,
+// the pointer is returned as an int for objc.objc_object(c_void_p=...). The caller owns
+// the reference and must hand it back to cfrelease() once the proxy has retained it (an
+// autoreleased pointer would leak whenever there's no pool, e.g., a plain `import plotdevice`)
+static PyObject *
+cPathmatics_cgpath(PyObject *self, PyObject *args)
+{
+    PyObject *pyObject;
+    NSBezierPath *path;
+    CGMutablePathRef mutablePath;
+    CGPathRef cgPath;
+    NSPoint pts[3];
+    NSInteger i, count;
+
+    if (!PyArg_ParseTuple(args, "O", &pyObject))
+        return NULL;
+
+    if (strcmp("NSBezierPath", pyObject->ob_type->tp_name) != 0) {
+        PyErr_SetString(PyExc_TypeError, "argument is not a NSBezierPath");
+        return NULL;
+    }
+    path = ((PyObjCObject *) pyObject)->objc_object;
+
+    mutablePath = CGPathCreateMutable();
+    count = [path elementCount];
+    for (i = 0; i < count; i++) {
+        switch ([path elementAtIndex:i associatedPoints:pts]) {
+            case NSMoveToBezierPathElement:
+                CGPathMoveToPoint(mutablePath, NULL, pts[0].x, pts[0].y);
+                break;
+            case NSLineToBezierPathElement:
+                CGPathAddLineToPoint(mutablePath, NULL, pts[0].x, pts[0].y);
+                break;
+            case NSCurveToBezierPathElement:
+                CGPathAddCurveToPoint(mutablePath, NULL, pts[0].x, pts[0].y,
+                                                         pts[1].x, pts[1].y,
+                                                         pts[2].x, pts[2].y);
+                break;
+            case NSClosePathBezierPathElement:
+                CGPathCloseSubpath(mutablePath);
+                break;
+        }
+    }
+    cgPath = CGPathCreateCopy(mutablePath);
+    CGPathRelease(mutablePath);
+
+    return PyLong_FromVoidPtr((void *)cgPath);
+}
+
+// Releases a CoreFoundation reference returned (as an int) by cgpath()
+static PyObject *
+cPathmatics_cfrelease(PyObject *self, PyObject *args)
+{
+    PyObject *pyPointer;
+    void *ref;
+
+    if (!PyArg_ParseTuple(args, "O", &pyPointer))
+        return NULL;
+
+    ref = PyLong_AsVoidPtr(pyPointer);
+    if (ref == NULL) {
+        if (!PyErr_Occurred())
+            PyErr_SetString(PyExc_ValueError, "can't release a NULL reference");
+        return NULL;
+    }
+    CFRelease(ref);
+
+    Py_RETURN_NONE;
+}
+
+// Returns the contents of an NSBezierPath as a tuple of (cmd, points) pairs, fetching
+// every element in one call rather than one elementAtIndex_associatedPoints_ per element.
+static PyObject *
+cPathmatics_elements(PyObject *self, PyObject *args)
+{
+    PyObject *pyObject, *result, *points, *item;
+    NSBezierPath *path;
+    NSBezierPathElement cmd;
+    NSPoint pts[3];
+    NSInteger i, j, count, numPoints;
+
+    if (!PyArg_ParseTuple(args, "O", &pyObject))
+        return NULL;
+
+    if (strcmp("NSBezierPath", pyObject->ob_type->tp_name) != 0) {
+        PyErr_SetString(PyExc_TypeError, "argument is not a NSBezierPath");
+        return NULL;
+    }
+    path = ((PyObjCObject *) pyObject)->objc_object;
+
+    count = [path elementCount];
+    result = PyTuple_New(count);
+    if (result == NULL)
+        return NULL;
+
+    for (i = 0; i < count; i++) {
+        cmd = [path elementAtIndex:i associatedPoints:pts];
+        switch (cmd) {
+            case NSCurveToBezierPathElement:
+                numPoints = 3;
+                break;
+            case NSClosePathBezierPathElement:
+                numPoints = 0;
+                break;
+            default:
+                numPoints = 1;
+        }
+
+        points = PyTuple_New(numPoints);
+        if (points == NULL) {
+            Py_DECREF(result);
+            return NULL;
+        }
+        for (j = 0; j < numPoints; j++) {
+            item = Py_BuildValue("(dd)", pts[j].x, pts[j].y);
+            if (item == NULL) {
+                Py_DECREF(points);
+                Py_DECREF(result);
+                return NULL;
+            }
+            PyTuple_SET_ITEM(points, j, item);
+        }
+
+        // use O rather than N so points is released below whether or not the build succeeds
+        item = Py_BuildValue("(iO)", (int)cmd, points);
+        Py_DECREF(points);
+        if (item == NULL) {
+            Py_DECREF(result);
+            return NULL;
+        }
+        PyTuple_SET_ITEM(result, i, item);
+    }
+
+    return result;
+}
+
 
 
 /*
@@ -599,6 +764,87 @@ int xmain(int argc, char *argv[])
 
 */
 
+// Returns a list with the length of each segment in an NSBezierPath, measuring curves
+// with n line segments (or by adaptive subdivision if n is 0). Walks the elements directly rather than building a Curve per
+// element and crossing back into python for each line/curvelength call.
+static PyObject *
+cPathmatics_segment_lengths(PyObject *self, PyObject *args)
+{
+    PyObject *pyObject, *result, *item;
+    NSBezierPath *path;
+    NSBezierPathElement cmd;
+    NSPoint pts[3], start, last, end;
+    NSInteger i, count;
+    int n = 20;
+    double length;
+
+    if (!PyArg_ParseTuple(args, "O|i", &pyObject, &n))
+        return NULL;
+
+    if (strcmp("NSBezierPath", pyObject->ob_type->tp_name) != 0) {
+        PyErr_SetString(PyExc_TypeError, "argument is not a NSBezierPath");
+        return NULL;
+    }
+    path = ((PyObjCObject *) pyObject)->objc_object;
+
+    result = PyList_New(0);
+    if (result == NULL)
+        return NULL;
+
+    start = last = NSZeroPoint;
+    count = [path elementCount];
+    for (i = 0; i < count; i++) {
+        cmd = [path elementAtIndex:i associatedPoints:pts];
+        switch (cmd) {
+            case NSCurveToBezierPathElement:
+                end = pts[2];
+                break;
+            case NSClosePathBezierPathElement:
+                end = NSZeroPoint;
+                break;
+            default:
+                end = pts[0];
+        }
+
+        if (i == 0) {
+            start = end;
+        } else {
+            switch (cmd) {
+                case NSMoveToBezierPathElement:
+                    start = end;
+                    length = 0.0;
+                    break;
+                case NSClosePathBezierPathElement:
+                    _linelength(last.x, last.y, start.x, start.y, &length);
+                    break;
+                case NSLineToBezierPathElement:
+                    _linelength(last.x, last.y, end.x, end.y, &length);
+                    break;
+                default:
+                    if (n > 0)
+                        _curvelength(last.x, last.y, pts[0].x, pts[0].y, pts[1].x, pts[1].y,
+                                     end.x, end.y, n, &length);
+                    else
+                        length = _curvelength_adaptive(last.x, last.y, pts[0].x, pts[0].y,
+                                                       pts[1].x, pts[1].y, end.x, end.y, 0);
+            }
+
+            item = PyFloat_FromDouble(length);
+            if (item == NULL || PyList_Append(result, item) < 0) {
+                Py_XDECREF(item);
+                Py_DECREF(result);
+                return NULL;
+            }
+            Py_DECREF(item);
+        }
+
+        if (cmd != NSClosePathBezierPathElement)
+            last = end;
+    }
+
+    return result;
+}
+
 
 static PyMethodDef PathmaticsMethods[] = {
     // pathmatics
@@ -612,6 +858,10 @@ static PyMethodDef PathmaticsMethods[] = {
     {"intersect",  cPathmatics_intersect, METH_VARARGS, "Calculates the intersection of two NSBezierPaths."},
     {"difference",  cPathmatics_difference, METH_VARARGS, "Calculates the difference of two NSBezierPaths."},
     {"xor",  cPathmatics_xor, METH_VARARGS, "Calculates the exclusive or of two NSBezierPaths."},
+    {"cgpath",  cPathmatics_cgpath, METH_VARARGS, "Converts an NSBezierPath to a CGPath."},
+    {"cfrelease",  cPathmatics_cfrelease, METH_VARARGS, "Releases a CGPath returned by cgpath."},
+    {"elements",  cPathmatics_elements, METH_VARARGS, "Returns the (cmd, points) pairs of an NSBezierPath."},
+    {"segment_lengths",  cPathmatics_segment_lengths, METH_VARARGS, "Returns the length of each segment in an NSBezierPath."},
     {NULL, NULL, 0, NULL}        /* Sentinel */
 };
 
@@ -3,7 +3,7 @@ from setuptools.extension import Extension
 
 cPathmatics = Extension("cPathmatics",
                         sources = ["pathmatics.m", "gpc.c",],
-                        extra_link_args=['-framework', 'AppKit', '-framework', 'Foundation'],
+                        extra_link_args=['-framework', 'AppKit', '-framework', 'Foundation', '-framework', 'ApplicationServices'],
                         extra_compile_args=['-Qunused-arguments'])
 
 setup (name = "pathmatics",
@@ -1,5 +1,5 @@
 # encoding: utf-8
-import os, re, types
+import os, re, types, math
 from contextlib import contextmanager, nested
 from collections import namedtuple
 from os.path import exists, expanduser
@@ -10,6 +10,7 @@ from .util import _copy_attr, _copy_attrs, _flatten, trim_zeroes
 from .lib import geometry, pathmatics
 from .gfx.transform import Dimension
 from .gfx import *
+from .gfx import _cg_reset
 from . import gfx, lib, util, Halted, DeviceError
 
 __all__ = ('Context', 'Canvas')
@@ -1181,11 +1182,16 @@ class Context(object):
 
     ### Geometry
 
-    def _angle(self, theta, dst_mode=RADIANS):
-        """Used internally to map the current theta unit into other scales"""
-        src_mode = self._thetamode
+    def _angle(self, theta, dst_mode=RADIANS, src_mode=None):
+        """Used internally to map the current theta unit (or src_mode's) into other scales"""
+        if src_mode is None:
+            src_mode = self._thetamode
         if dst_mode==src_mode:
             return theta
+        elif (src_mode, dst_mode) == (DEGREES, RADIANS):
+            return math.radians(theta)
+        elif (src_mode, dst_mode) == (RADIANS, DEGREES):
+            return math.degrees(theta)
         basis={DEGREES:360.0, RADIANS:2*pi, PERCENT:1.0}
         return (theta*basis[dst_mode])/basis[src_mode]
 
@@ -1394,8 +1400,9 @@ class Canvas(object):
             # it might be wiser to have this factor into ctx.transform so it doesn't end up
             # scaling stroke widths...
             t = Transform()
-            t.scale(self.unit.basis)
+            t._scale(self.unit.basis, self.unit.basis)
             t.concat()
+        _cg_reset() # the line settings start out at their defaults in every render
         for grob in self._grobs:
             grob._draw()
         # import cProfile
@@ -21,8 +21,12 @@ def _ns_context():
 def _cg_context():
     port = NSGraphicsContext.currentContext().graphicsPort()
     CGContextSaveGState(port)
-    yield port
-    CGContextRestoreGState(port)
+    _pen_stack.append(dict(_pen_stack[-1]))
+    try:
+        yield port
+    finally:
+        _pen_stack.pop()
+        CGContextRestoreGState(port)
 
 @contextmanager
 def _cg_layer():
@@ -34,6 +38,34 @@ def _cg_layer():
 def _cg_port():
     return NSGraphicsContext.currentContext().graphicsPort()
 
+### line-style state tracking ###
+
+# shadows the CG gstate stack with the line settings known to be in effect at each
+# level. an empty dict means `unknown' (so nothing will be skipped)
+_pen_stack = [{}]
+
+def _cg_reset():
+    """Mark the current gstate as having CoreGraphics' default line settings"""
+    _pen_stack[:] = [dict(width=1.0, cap=kCGLineCapButt, join=kCGLineJoinMiter, dash=None)]
+
+def _cg_pen(port, width, cap, join, dash=None):
+    """Set the line style, skipping any CGContextSet* calls that wouldn't change it"""
+    pen = _pen_stack[-1]
+    if pen.get('width') != width:
+        CGContextSetLineWidth(port, width)
+        pen['width'] = width
+    if pen.get('cap') != cap:
+        CGContextSetLineCap(port, cap)
+        pen['cap'] = cap
+    if pen.get('join') != join:
+        CGContextSetLineJoin(port, join)
+        pen['join'] = join
+    if dash:
+        dash = tuple(dash)
+        if pen.get('dash') != dash:
+            CGContextSetLineDash(port, 0, dash, len(dash))
+            pen['dash'] = dash
+
 ### submodule init ###
 
 # pool the submodules' __all__ namespaces into our own
@@ -243,7 +243,7 @@ class TransformMixin(Grob):
     transform = property(_get_transform, _set_transform)
 
     def translate(self, x=0, y=0):
-        self._transform.translate(x,y)
+        self._transform._translate(x,y)
         return self
 
     def rotate(self, arg=None, **opts):
@@ -251,7 +251,7 @@ class TransformMixin(Grob):
         return self
 
     def scale(self, x=1, y=None):
-        self._transform.scale(x,y)
+        self._transform._scale(x, x if y is None else y)
         return self
 
     def skew(self, x=0, y=0):
@@ -4,11 +4,11 @@ from ..lib.cocoa import *
 from math import pi, sin, cos, sqrt
 
 from plotdevice import DeviceError
-from . import _cg_context
+from . import _cg_context, _cg_pen
 from .atoms import PenMixin, TransformMixin, ColorMixin, EffectsMixin, Grob
 from .colors import Color, Gradient, Pattern
-from .transform import CENTER, Transform, Region, Size, Point, DEGREES
-from ..util import trim_zeroes, _copy_attr, _copy_attrs, _flatten, numlike
+from .transform import CENTER, Transform, Region, Size, Point, DEGREES, _ns_transform
+from ..util import _trim, _copy_attr, _copy_attrs, _flatten, numlike
 from ..lib import pathmatics, geometry
 
 _ctx = None
@@ -39,6 +39,18 @@ _CAPSTYLE={BUTT:kCGLineCapButt, ROUND:kCGLineCapRound, SQUARE:kCGLineCapSquare}
 # arrow styles
 NORMAL = "normal"
 FORTYFIVE = "fortyfive"
+_ARROWHEADS={ # vertices for an arrow of width 1 pointing at 0,0
+    NORMAL:[(0,0), (-.4,.4), (-.4,.2), (-1,.2), (-1,-.2), (-.4,-.2), (-.4,-.4), (0,0)],
+    FORTYFIVE:[(0,0), (0,.7), (-.3,1), (-.3,.52), (-.78,1), (-1,.78), (-.52,.3), (-1,.3), (-.7,0), (0,0)],
+}
+
+# path commands for adding a Curve to a Bezier (see Bezier.append)
+_APPENDERS={
+    MOVETO:lambda pth, el: pth.moveto(el.x, el.y),
+    LINETO:lambda pth, el: pth.lineto(el.x, el.y),
+    CURVETO:lambda pth, el: pth.curveto(el.ctrl1.x, el.ctrl1.y, el.ctrl2.x, el.ctrl2.y, el.x, el.y),
+    CLOSE:lambda pth, el: pth.closepath(),
+}
 
 class Bezier(EffectsMixin, TransformMixin, ColorMixin, PenMixin, Grob):
     """A Bezier provides a wrapper around NSBezierPath."""
@@ -46,7 +58,16 @@ class Bezier(EffectsMixin, TransformMixin, ColorMixin, PenMixin, Grob):
 
     def __init__(self, path=None, immediate=False, **kwargs):
         super(Bezier, self).__init__(**kwargs)
-        self._segment_cache = {} # used by pathmatics
+        self._segment_cache = {} # used by pathmatics (keyed by relative & n)
+        self._coefficient_cache = None # used by point() & points()
+        self._offset_cache = None # ditto
+        self._arclength_cache = None # ditto (for evenly spaced points)
+        self._screen_cache = None # (key, xf) pair for the CENTER-mode _screen_transform
+        self._linestyle_cache = None # (penstyle, cap, join) with the latter two as kCG constants
+        self._bounds_cache = None # cleared whenever the path is modified
+        self._cgPath_cache = None # ditto
+        self._elements_cache = None # ditto
+        self._flattened_cache = None # ditto
         self._fulcrum = None # centerpoint (set only for primitives)
 
         # path arg might contain a list of point tuples, a bezier to copy, or a raw
@@ -102,19 +123,33 @@ class Bezier(EffectsMixin, TransformMixin, ColorMixin, PenMixin, Grob):
         warnings.warn("The 'path' attribute is deprecated. Please use _nsBezierPath instead.", DeprecationWarning, stacklevel=2)
         return self._nsBezierPath
 
+    def _invalidate(self):
+        # called after every change to the underlying NSBezierPath
+        self._bounds_cache = None
+        self._cgPath_cache = None
+        self._elements_cache = None
+        self._flattened_cache = None
+        self._segment_cache.clear()
+        self._coefficient_cache = None
+        self._offset_cache = None
+        self._arclength_cache = None
+
     ### Path methods ###
 
     def moveto(self, x, y):
         self._nsBezierPath.moveToPoint_( (x, y) )
+        self._invalidate()
 
     def lineto(self, x, y):
         if self._nsBezierPath.elementCount()==0:
             # use an implicit 0,0 origin if path doesn't have a prior moveto
             self._nsBezierPath.moveToPoint_( (0, 0) )
         self._nsBezierPath.lineToPoint_( (x, y) )
+        self._invalidate()
 
     def curveto(self, x1, y1, x2, y2, x3, y3):
         self._nsBezierPath.curveToPoint_controlPoint1_controlPoint2_( (x3, y3), (x1, y1), (x2, y2) )
+        self._invalidate()
 
     def arcto(self, x1, y1, x2=None, y2=None, radius=None, ccw=False):
         if x2 is not None and y2 is not None:
@@ -127,6 +162,7 @@ class Bezier(EffectsMixin, TransformMixin, ColorMixin, PenMixin, Grob):
             radius = 1.0 if radius is None else radius
             self._nsBezierPath.appendBezierPathWithArcFromPoint_toPoint_radius_( (x1,y1), (x2,y2), radius)
             self._nsBezierPath.lineToPoint_( (x2,y2) )
+            self._invalidate()
         else:
             # create a unitary semicircle...
             k = 0.5522847498 / 2.0
@@ -141,22 +177,25 @@ class Bezier(EffectsMixin, TransformMixin, ColorMixin, PenMixin, Grob):
             dw = geometry.distance(src.x, src.y, x1, y1)
             dh = dw*(-1.0 if ccw else 1.0)
             t = Transform()
-            t.translate(src.x,src.y)
+            t._translate(src.x,src.y)
             t.rotate(-theta)
-            t.scale(dw, dh)
+            t._scale(dw, dh)
             p.transformUsingAffineTransform_(t._nsAffineTransform)
             self.extend(Bezier(p)[1:]) # omit the initial moveto in the semicircle
 
     def closepath(self):
         self._nsBezierPath.closePath()
+        self._invalidate()
 
     @property
     def bounds(self):
-        try:
-            return Region(*self._nsBezierPath.bounds())
-        except:
-            # Path is empty -- no bounds
-            return Region()
+        if self._bounds_cache is None:
+            try:
+                self._bounds_cache = Region(*self._nsBezierPath.bounds())
+            except:
+                # Path is empty -- no bounds
+                self._bounds_cache = Region()
+        return self._bounds_cache
 
     @property
     def center(self):
@@ -167,7 +206,16 @@ class Bezier(EffectsMixin, TransformMixin, ColorMixin, PenMixin, Grob):
             return Point(x+w/2, y+h/2)
 
     def contains(self, x, y):
-        return self._nsBezierPath.containsPoint_((x,y))
+        # skip points that can't possibly be inside before asking cocoa
+        (left, top), (width, height) = self.bounds
+        if not (left <= x <= left+width and top <= y <= top+height):
+            return False
+
+        # hit-test against a pre-flattened copy so the curves aren't re-flattened on every call
+        if self._flattened_cache is None:
+            self._flattened_cache = self._nsBezierPath.bezierPathByFlatteningPath()
+            self._flattened_cache.setWindingRule_(self._nsBezierPath.windingRule())
+        return self._flattened_cache.containsPoint_((x,y))
 
     ### Basic shapes (origin + size) ###
 
@@ -181,6 +229,7 @@ class Bezier(EffectsMixin, TransformMixin, ColorMixin, PenMixin, Grob):
                 badradius = 'the radius for a rect must be either a number or an (x,y) tuple'
                 raise DeviceError(badradius)
             self._nsBezierPath.appendBezierPathWithRoundedRect_xRadius_yRadius_( ((x,y), (width,height)), *radius)
+        self._invalidate()
 
     def oval(self, x, y, width, height, rng=None, ccw=False, close=False):
         # range = None:      draw a full ellipse
@@ -198,17 +247,17 @@ class Bezier(EffectsMixin, TransformMixin, ColorMixin, PenMixin, Grob):
                 start, end = -start, -end
             start, end = _ctx._angle(start, DEGREES), _ctx._angle(end, DEGREES)
 
+            # draw the arc in a unit square then stretch it to fit the rect (with the
+            # scale & offset written straight into the matrix rather than concatenated)
             p = NSBezierPath.bezierPath()
             p.appendBezierPathWithArcWithCenter_radius_startAngle_endAngle_clockwise_((.5,.5), .5, start, end, ccw)
-            t = Transform()
-            t.translate(x,y)
-            t.scale(width, height)
-            p.transformUsingAffineTransform_(t._nsAffineTransform)
+            p.transformUsingAffineTransform_(_ns_transform((width, 0, 0, height, x, y)))
             self._nsBezierPath.appendBezierPath_(p)
             if close:
                 # optionally close the path with a chord
                 self._nsBezierPath.closePath()
             self._fulcrum = Point(x+width/2, y+width/2)
+        self._invalidate()
     ellipse = oval
 
     def line(self, x1, y1, x2, y2, ccw=None):
@@ -218,6 +267,7 @@ class Bezier(EffectsMixin, TransformMixin, ColorMixin, PenMixin, Grob):
         else:
             self._nsBezierPath.moveToPoint_( (x1, y1) )
             self._nsBezierPath.lineToPoint_( (x2, y2) )
+            self._invalidate()
 
     ### Radial shapes (center + radius) ###
 
@@ -246,12 +296,14 @@ class Bezier(EffectsMixin, TransformMixin, ColorMixin, PenMixin, Grob):
         angles = [2*pi * i/sides - theta for i in xrange(sides)]
 
         # walk around the circle adding points with proper scale/origin
-        points = [ [radius*cos(theta)+x, radius*sin(theta)+y] for theta in angles]
+        points = [ (radius*cos(theta)+x, radius*sin(theta)+y) for theta in angles]
+
+        # add the edges with a single call rather than a lineto per vertex
         self._nsBezierPath.moveToPoint_(points[0])
-        for pt in points[1:]:
-            self._nsBezierPath.lineToPoint_(pt)
+        self._nsBezierPath.appendBezierPathWithPoints_count_(points[1:], len(points)-1)
         self._nsBezierPath.closePath()
         self._fulcrum = Point(x,y)
+        self._invalidate()
 
     def arc(self, x, y, r, rng=None, ccw=False, close=False):
         if not rng:
@@ -273,18 +325,27 @@ class Bezier(EffectsMixin, TransformMixin, ColorMixin, PenMixin, Grob):
             self._nsBezierPath.lineToPoint_( (x,y) )
             self._nsBezierPath.closePath()
         self._fulcrum = Point(x,y)
+        self._invalidate()
 
     def star(self, x, y, points=20, outer=100, inner=None):
+        """Adds a star with the given number of points (or just its top vertex if there are none)
+
+        >>> path = Bezier(None)
+        >>> path.star(0, 0, points=0)
+        >>> len(path)
+        2
+        """
         # if inner radius is unspecified, default to half-size
         if inner is None:
             inner = outer * 0.5
 
+        # alternate between the outer and inner radius at each step around the circle
+        radii = (outer, inner)
+        step = pi / points if points else 0.0
+        vertices = [(x+radii[i%2]*sin(i*step), y+radii[i%2]*cos(i*step)) for i in xrange(1, int(2 * points))]
+
         self._nsBezierPath.moveToPoint_( (x, y+outer) )
-        for i in range(1, int(2 * points)):
-          angle = i * pi / points
-          radius = inner if i % 2 else outer
-          pt = (x+radius*sin(angle), y+radius*cos(angle))
-          self._nsBezierPath.lineToPoint_(pt)
+        self._nsBezierPath.appendBezierPathWithPoints_count_(vertices, len(vertices))
         self.closepath()
 
     def arrow(self, x, y, width=100, type=NORMAL):
@@ -292,53 +353,54 @@ class Bezier(EffectsMixin, TransformMixin, ColorMixin, PenMixin, Grob):
             badtype = "available types for arrow() are NORMAL and FORTYFIVE"
             raise DeviceError(badtype)
 
+        # scale & offset the unit template then add the edges with a single call
+        points = [(x+width*dx, y+width*dy) for dx,dy in _ARROWHEADS[type]]
+        self._nsBezierPath.moveToPoint_(points[0])
+        self._nsBezierPath.appendBezierPathWithPoints_count_(points[1:], len(points)-1)
         if type==NORMAL:
-            head = width * .4
-            tail = width * .2
-            self.moveto(x, y)
-            self.lineto(x-head, y+head)
-            self.lineto(x-head, y+tail)
-            self.lineto(x-width, y+tail)
-            self.lineto(x-width, y-tail)
-            self.lineto(x-head, y-tail)
-            self.lineto(x-head, y-head)
-            self.lineto(x, y)
-            self.closepath()
-        elif type==FORTYFIVE:
-            head = .3
-            tail = 1 + head
-            self.moveto(x, y)
-            self.lineto(x, y+width*(1-head))
-            self.lineto(x-width*head, y+width)
-            self.lineto(x-width*head, y+width*tail*.4)
-            self.lineto(x-width*tail*.6, y+width)
-            self.lineto(x-width, y+width*tail*.6)
-            self.lineto(x-width*tail*.4, y+width*head)
-            self.lineto(x-width, y+width*head)
-            self.lineto(x-width*(1-head), y)
-            self.lineto(x, y)
+            self._nsBezierPath.closePath()
         self._fulcrum = Point(x,y)
+        self._invalidate()
 
     ### List methods ###
 
+    @property
+    def _elements(self):
+        # the (cmd, points) pairs for the whole path, fetched in one go and then reused
+        # until the path changes. Curves are built on demand since they're mutable
+        if self._elements_cache is None:
+            self._elements_cache = pathmatics.elements(self._nsBezierPath)
+        return self._elements_cache
+
     def __getitem__(self, index):
         if isinstance(index, slice):
             # slice-based access
-            pts = [self._nsBezierPath.elementAtIndex_associatedPoints_(i) for i in xrange(*index.indices(len(self)))]
-            return [Curve(cmd, el) for cmd,el in pts]
+            return [Curve(cmd, el) for cmd,el in self._elements[index]]
         else:
             # index-based access
-            cmd, el = self._nsBezierPath.elementAtIndex_associatedPoints_(index)
+            cmd, el = self._elements[index]
             return Curve(cmd, el)
 
     def __iter__(self):
-        for i in range(len(self)):
-            yield self[i]
+        for cmd, el in self._elements:
+            yield Curve(cmd, el)
 
     def __len__(self):
         return self._nsBezierPath.elementCount()
 
     def extend(self, pathElements):
+        pathElements = list(pathElements)
+        if pathElements and all(isinstance(el, (list, tuple)) for el in pathElements):
+            # add a list of bare coordinates with a single call rather than an append() per
+            # point. the first point becomes a moveto if the path is empty or a lineto otherwise
+            if len(self) > 0:
+                self._nsBezierPath.lineToPoint_(pathElements[0])
+                pathElements = pathElements[1:]
+            self._nsBezierPath.appendBezierPathWithPoints_count_(pathElements, len(pathElements))
+            self._fulcrum = None
+            self._invalidate()
+            return
+
         for el in pathElements:
             if isinstance(el, (list, tuple)):
                 x, y = el
@@ -354,15 +416,9 @@ class Bezier(EffectsMixin, TransformMixin, ColorMixin, PenMixin, Grob):
                 raise DeviceError(wrongtype)
 
     def append(self, el):
-        if el.cmd == MOVETO:
-            self.moveto(el.x, el.y)
-        elif el.cmd == LINETO:
-            self.lineto(el.x, el.y)
-        elif el.cmd == CURVETO:
-            c1, c2 = el.ctrl1, el.ctrl2
-            self.curveto(c1.x, c1.y, c2.x, c2.y, el.x, el.y)
-        elif el.cmd == CLOSE:
-            self.closepath()
+        fn = _APPENDERS.get(el.cmd)
+        if fn:
+            fn(self, el)
         self._fulcrum = None
 
     @property
@@ -376,34 +432,34 @@ class Bezier(EffectsMixin, TransformMixin, ColorMixin, PenMixin, Grob):
         """Returns the Transform object that will be used to draw the path."""
 
         if (self.transformmode == CENTER):
-            # if center-based, sandwich transform with a scoot out/in to the origin
-            dx, dy = self.center
-            nudge = Transform()
-            nudge.translate(-dx, -dy)
-            xf = self.transform.copy()
-            xf.prepend(nudge)
-            xf.append(nudge.inverse)
-            return xf
+            # the result only depends on the transform's matrix and the path's center, so
+            # reuse the previous one if neither has changed since the last draw
+            key = (tuple(self.transform), tuple(self.center))
+            if self._screen_cache is None or self._screen_cache[0] != key:
+                # if center-based, sandwich transform with a scoot out/in to the origin
+                dx, dy = key[1]
+                xf = self.transform.copy()
+                xf._translate(-dx, -dy)
+                xf.append(Transform((1, 0, 0, 1, dx, dy)))
+                self._screen_cache = (key, xf)
+            return self._screen_cache[1]
         else:
             return self.transform
 
+    @property
+    def _cg_linestyle(self):
+        # resolve the cap & join names to their CG constants once per penstyle rather
+        # than once per draw (the penstyle tuple is replaced whenever one is changed)
+        pen = self._penstyle
+        if self._linestyle_cache is None or self._linestyle_cache[0] is not pen:
+            self._linestyle_cache = (pen, _CAPSTYLE[pen.cap], _JOINSTYLE[pen.join])
+        return self._linestyle_cache[1:]
+
     @property
     def cgPath(self):
-        # this really ought to live in pathmatics...
-        ns = self._nsBezierPath
-        cg = CGPathCreateMutable()
-        for cmd, points in (ns.elementAtIndex_associatedPoints_(i) for i in xrange(ns.elementCount())):
-            if cmd==NSMoveToBezierPathElement:
-                CGPathMoveToPoint(cg, None, points[0].x, points[0].y)
-            elif cmd==NSLineToBezierPathElement:
-                CGPathAddLineToPoint(cg, None, points[0].x, points[0].y)
-            elif cmd==NSCurveToBezierPathElement:
-                CGPathAddCurveToPoint(cg, None, points[0].x, points[0].y,
-                                                points[1].x, points[1].y,
-                                                points[2].x, points[2].y)
-            elif cmd==NSClosePathBezierPathElement:
-                CGPathCloseSubpath(cg)
-        return CGPathCreateCopy(cg)
+        if self._cgPath_cache is None:
+            self._cgPath_cache = pathmatics.cgpath(self._nsBezierPath)
+        return self._cgPath_cache
 
     def _draw(self):
         with _cg_context() as port:
@@ -420,11 +476,8 @@ class Bezier(EffectsMixin, TransformMixin, ColorMixin, PenMixin, Grob):
                 if (self._strokecolor):
                     ink = kCGPathStroke if ink is None else kCGPathFillStroke
                     CGContextSetStrokeColorWithColor(port, self._strokecolor.cgColor)
-                    CGContextSetLineWidth(port, self.nib)
-                    CGContextSetLineCap(port, _CAPSTYLE[self.cap])
-                    CGContextSetLineJoin(port, _JOINSTYLE[self.join])
-                    if self.dash:
-                        CGContextSetLineDash(port, 0, self.dash, len(self.dash))
+                    cap, join = self._cg_linestyle
+                    _cg_pen(port, self.nib, cap, join, self.dash)
 
                 # use cocoa for patterns/gradients
                 if isinstance(self._fillcolor, (Gradient, Pattern)):
@@ -454,79 +507,127 @@ class Bezier(EffectsMixin, TransformMixin, ColorMixin, PenMixin, Grob):
         """
 
         (px, py), (pw, ph) = self.bounds
-        t = Transform()
-        if x is not None and y is None:
-            t.translate(x, py)
-        elif x is None and y is not None:
-            t.translate(px, y)
-        elif x is not None and y is not None:
-            t.translate(x, y)
-        else:
-            t.translate(px, py)
         if width is not None and height is None:
-            t.scale(width / pw)
+            sx = sy = width / pw
         elif width is None and height is not None:
-            t.scale(height / ph)
+            sx = sy = height / ph
         elif width is not None and height is not None:
             if stretch:
-                t.scale(width /pw, height / ph)
+                sx, sy = width / pw, height / ph
             else:
-                t.scale(min(width /pw, height / ph))
-        t.translate(-px, -py)
-        self._nsBezierPath = t.apply(self)._nsBezierPath
-        self._fulcrum = t.apply(self._fulcrum) if self._fulcrum else None
-        self._segment_cache = {}
+                sx = sy = min(width / pw, height / ph)
+        else:
+            sx = sy = 1.0
+
+        # scale the path about its origin then move it to x,y (with the whole matrix
+        # built in one step rather than composed from successive translate/scale calls)
+        tx = (px if x is None else x) - px*sx
+        ty = (py if y is None else y) - py*sy
+        xf = _ns_transform((sx, 0, 0, sy, tx, ty))
+        self._nsBezierPath = xf.transformBezierPath_(self._nsBezierPath)
+        if self._fulcrum:
+            self._fulcrum = Point(self._fulcrum.x*sx + tx, self._fulcrum.y*sy + ty)
+        self._invalidate()
 
 
     ### Mathematics ###
 
-    def segmentlengths(self, relative=False, n=10):
-        if relative: # Use the opportunity to store the segment cache.
-            key = (len(self), self.bounds)
-            if key not in self._segment_cache:
-                self._segment_cache = {key:pathmatics.segment_lengths(self, relative=True, n=n)}
-            return self._segment_cache[key]
-        else:
-            return pathmatics.segment_lengths(self, relative=False, n=n)
+    def segmentlengths(self, relative=False, n=None):
+        # absolute lengths are measured adaptively unless a sample count is given, but the
+        # relative ones (which point() & points() rely on) keep using 10 chords per curve
+        if relative and n is None:
+            n = 10
+
+        # both the absolute and relative lengths are cached until the path is modified
+        key = (relative, n)
+        if key not in self._segment_cache:
+            self._segment_cache[key] = pathmatics.segment_lengths(self, relative=relative, n=n)
+        return self._segment_cache[key]
 
     @property
-    def length(self, segmented=False, n=10):
-        return pathmatics.length(self, segmented=segmented, n=n)
+    def length(self):
+        return sum(self.segmentlengths(), 0.0)
+
+    @property
+    def _coefficients(self):
+        # per-segment polynomial terms for batch evaluation (see pathmatics.coefficients)
+        if self._coefficient_cache is None:
+            self._coefficient_cache = pathmatics.coefficients(self)
+        return self._coefficient_cache
+
+    @property
+    def _offsets(self):
+        # running totals of the relative segment lengths (for locating t)
+        if self._offset_cache is None:
+            self._offset_cache = pathmatics.segment_offsets(self.segmentlengths(relative=True))
+        return self._offset_cache
+
+    @property
+    def _arclengths(self):
+        # distance->t lookup table used by points(even=True)
+        if self._arclength_cache is None:
+            self._arclength_cache = pathmatics.arclength_table(self._coefficients)
+        return self._arclength_cache
 
     def point(self, t):
-        return pathmatics.point(self, t)
+        return pathmatics.point(self, t, self.segmentlengths(relative=True), self._coefficients, self._offsets)
 
-    def points(self, amount=100):
+    def points(self, amount=100, even=False):
         if len(self) == 0:
             empty = "The given path is empty"
             raise DeviceError(empty)
 
         count = int(amount) # make sure we don't choke on a float
-        delta = 1.0/max(1, count-1) # div by count-1 so the last point is at t=1.0
-        for i in xrange(count):
-            yield pathmatics.point(self, delta*i)
+        table = self._arclengths if even else None
+        return pathmatics.points(self, count, even, self.segmentlengths(relative=True),
+                                 self._coefficients, self._offsets, table)
 
     def addpoint(self, t):
         self._nsBezierPath = pathmatics.insert_point(self, t)._nsBezierPath
+        self._invalidate()
 
     ### Clipping operations ###
 
+    def _disjoint(self, other):
+        # the paths can't overlap if their bounding boxes don't
+        (ax, ay), (aw, ah) = self.bounds
+        (bx, by), (bw, bh) = other.bounds
+        return ax+aw < bx or bx+bw < ax or ay+ah < by or by+bh < ay
+
+    def _combined(self, other):
+        # a path containing both shapes (used when they don't overlap)
+        p = self._nsBezierPath.copy()
+        p.appendBezierPath_(other._nsBezierPath)
+        return p
+
     def intersects(self, other):
+        if self._disjoint(other):
+            return False
         return pathmatics.intersects(self._nsBezierPath, other._nsBezierPath)
 
     def union(self, other, flatness=0.6):
+        if self._disjoint(other):
+            return Bezier(self._combined(other))
         return Bezier(pathmatics.union(self._nsBezierPath, other._nsBezierPath, flatness))
 
     def intersect(self, other, flatness=0.6):
+        if self._disjoint(other):
+            return Bezier()
         return Bezier(pathmatics.intersect(self._nsBezierPath, other._nsBezierPath, flatness))
 
     def difference(self, other, flatness=0.6):
+        if self._disjoint(other):
+            return Bezier(self._nsBezierPath.copy())
         return Bezier(pathmatics.difference(self._nsBezierPath, other._nsBezierPath, flatness))
 
     def xor(self, other, flatness=0.6):
+        if self._disjoint(other):
+            return Bezier(self._combined(other))
         return Bezier(pathmatics.xor(self._nsBezierPath, other._nsBezierPath, flatness))
 
 class Curve(object):
+    # curves are created in bulk when iterating over paths so skip the per-instance __dict__
+    __slots__ = ('cmd', 'x', 'y', 'ctrl1', 'ctrl2')
 
     def __init__(self, cmd=None, pts=None):
         self.cmd = cmd
@@ -555,15 +656,15 @@ class Curve(object):
             self.ctrl1 = Point()
             self.ctrl2 = Point()
 
-    @trim_zeroes
     def __repr__(self):
+        # (printing a path reprs every element, so skip the decorator's wrapper call)
         if self.cmd == MOVETO:
-            return "Curve(MOVETO, ((%.3f, %.3f),))" % (self.x, self.y)
+            return _trim("Curve(MOVETO, ((%.3f, %.3f),))" % (self.x, self.y))
         elif self.cmd == LINETO:
-            return "Curve(LINETO, ((%.3f, %.3f),))" % (self.x, self.y)
+            return _trim("Curve(LINETO, ((%.3f, %.3f),))" % (self.x, self.y))
         elif self.cmd == CURVETO:
-            return "Curve(CURVETO, ((%.3f, %.3f), (%.3f, %s), (%.3f, %.3f))" % \
-                (self.ctrl1.x, self.ctrl1.y, self.ctrl2.x, self.ctrl2.y, self.x, self.y)
+            return _trim("Curve(CURVETO, ((%.3f, %.3f), (%.3f, %s), (%.3f, %.3f))" % \
+                (self.ctrl1.x, self.ctrl1.y, self.ctrl2.x, self.ctrl2.y, self.x, self.y))
         elif self.cmd == CLOSE:
             return "Curve(CLOSE)"
 
@@ -218,13 +218,13 @@ class Image(EffectsMixin, TransformMixin, BoundsMixin, Grob):
         # calculate the translation offset for centering (if any)
         nudge = Transform()
         if self._transformmode == CENTER:
-            nudge.translate(self.size.width*factor/2, self.size.height*factor/2)
+            nudge._translate(self.size.width*factor/2, self.size.height*factor/2)
 
-        xf.translate(self.x, self.y) # set the position before applying transforms
+        xf._translate(self.x, self.y) # set the position before applying transforms
         xf.prepend(nudge)            # nudge the image to its center (or not)
         xf.prepend(self.transform)   # add context's CTM.
         xf.prepend(nudge.inverse)    # Move back to the real origin.
-        xf.scale(factor)             # scale to fit size constraints (if any)
+        xf._scale(factor, factor)    # scale to fit size constraints (if any)
         return xf
 
     def _draw(self):
@@ -7,8 +7,8 @@ import math
 from ..lib.cocoa import *
 
 from plotdevice import DeviceError
-from ..util import trim_zeroes
 from ..lib import geometry
+from ..lib.pathmatics import _bezier_classes
 
 _ctx = None
 __all__ = [
@@ -31,12 +31,24 @@ PERCENT = "percent"
 pi = math.pi
 tau = 2*pi
 
+def _num(n):
+    # format to 3 decimal places then drop the trailing zeroes (giving the same output as
+    # the trim_zeroes decorator without running a regex over the whole repr)
+    return ('%.3f' % n).rstrip('0').rstrip('.')
+
 ### tuple-like objects for grid dimensions ###
 
 class Point(object):
+    # points are created in bulk (curves, vertex lists, hit tests) so skip the per-instance __dict__
+    __slots__ = ('x', 'y')
+
     def __init__(self, *args, **kwargs):
         if len(args) == 2:
             self.x, self.y = args
+        elif not args:
+            # Point() & Point(x=…, y=…) are common enough to not route through the except
+            self.x = kwargs.get('x', 0.0)
+            self.y = kwargs.get('y', 0.0)
         else:
             try:
                 self.x, self.y = args[0]
@@ -44,9 +56,8 @@ class Point(object):
                 self.x = kwargs.get('x', 0.0)
                 self.y = kwargs.get('y', 0.0)
 
-    @trim_zeroes
     def __repr__(self):
-        return "Point(x=%.3f, y=%.3f)" % (self.x, self.y)
+        return "Point(x=%s, y=%s)" % (_num(self.x), _num(self.y))
 
     def __eq__(self, other):
         if other is None: return False
@@ -57,28 +68,40 @@ class Point(object):
 
     def __iter__(self):
         # allow for assignments like: x,y = Point()
-        return iter([self.x, self.y])
+        yield self.x
+        yield self.y
 
     # lib.geometry methods (accept either x,y pairs or Point args)
 
     def angle(self, x=0, y=0):
         if isinstance(x, Point):
-            x, y = x.__iter__()
-        theta = geometry.angle(self.x, self.y, x, y)
-        basis={DEGREES:360.0, RADIANS:2*pi, PERCENT:1.0}
-        return (theta*basis[_ctx._thetamode])/basis[DEGREES]
+            x, y = x.x, x.y
+        theta = geometry.angle(self.x, self.y, x, y) # in degrees
+        return _ctx._angle(theta, _ctx._thetamode, DEGREES)
 
 
     def distance(self, x=0, y=0):
         if isinstance(x, Point):
-            x, y = x.__iter__()
+            x, y = x.x, x.y
         return geometry.distance(self.x, self.y, x, y)
 
+    def angles(self, points):
+        """Returns a list with the angle to each of the Points (or x,y pairs) in a sequence"""
+        thetas = geometry.angles(self.x, self.y, points) # in degrees
+        mode = _ctx._thetamode
+        if mode == DEGREES:
+            return thetas
+        return [_ctx._angle(theta, mode, DEGREES) for theta in thetas]
+
+    def distances(self, points):
+        """Returns a list with the distance to each of the Points (or x,y pairs) in a sequence"""
+        return geometry.distances(self.x, self.y, points)
+
     def reflect(self, *args, **kwargs):
         d = kwargs.get('d', 1.0)
         a = kwargs.get('a', 180)
         if isinstance(args[0], Point):
-            (x,y), opts = args[0], args[1:]
+            (x,y), opts = (args[0].x, args[0].y), args[1:]
         else:
             (x,y), opts = args[:2], args[2:]
         if opts:
@@ -92,18 +115,22 @@ class Point(object):
         return Point(geometry.coordinates(self.x, self.y, distance, angle))
 
 class Size(tuple):
+    # the dimensions are read from the tuple itself, so skip the per-instance __dict__
+    __slots__ = ()
+
     def __new__(cls, width, height):
-        this = tuple.__new__(cls, (width, height))
-        for attr in ('w','width'): setattr(this, attr, width)
-        for attr in ('h','height'): setattr(this, attr, height)
-        return this
+        return tuple.__new__(cls, (width, height))
+
+    w = width = property(lambda self: self[0])
+    h = height = property(lambda self: self[1])
 
-    @trim_zeroes
     def __repr__(self):
-        return 'Size(width=%.3f, height=%.3f)'%self
+        return 'Size(width=%s, height=%s)'%tuple(map(_num, self))
 
 class Region(tuple):
     # Bug?: maybe this actually needs to be mutable...
+    __slots__ = ()
+
     def __new__(cls, x=0, y=0, w=0, h=0, **kwargs):
         if isinstance(x, NSRect):
             return Region(*x)
@@ -114,38 +141,69 @@ class Region(tuple):
             # accept both w/h and width/height spellings
             width = kwargs.get('width', w)
             height = kwargs.get('height', h)
-        this = tuple.__new__(cls, [(x,y), (width, height)])
-        for nm in ('x','y','width','height'):
-            if nm[1:]: setattr(this, nm[0], locals()[nm])
-            setattr(this, nm, locals()[nm])
-        this.origin = Point(x,y)
-        this.size = Size(width, height)
-        return this
-
-    @trim_zeroes
+        return tuple.__new__(cls, [(x,y), (width, height)])
+
+    x = property(lambda self: self[0][0])
+    y = property(lambda self: self[0][1])
+    w = width = property(lambda self: self[1][0])
+    h = height = property(lambda self: self[1][1])
+    origin = property(lambda self: Point(self[0]))
+    size = property(lambda self: Size(*self[1]))
+
     def __repr__(self):
-        return 'Region(x=%.3f, y=%.3f, w=%.3f, h=%.3f)'%(self[0]+self[1])
+        return 'Region(x=%s, y=%s, w=%s, h=%s)'%tuple(map(_num, self[0]+self[1]))
 
 
 ### NSAffineTransform wrapper used for positioning Grobs in a Context ###
 
+def _concat(first, then):
+    """Returns the matrix for applying the `first' transform followed by `then'"""
+    a11, a12, a21, a22, atx, aty = first
+    b11, b12, b21, b22, btx, bty = then
+    return (a11*b11 + a12*b21, a11*b12 + a12*b22,
+            a21*b11 + a22*b21, a21*b12 + a22*b22,
+            atx*b11 + aty*b21 + btx, atx*b12 + aty*b22 + bty)
+
+def _struct_of(transform):
+    """Returns the (m11, m12, m21, m22, tX, tY) tuple for a Transform or NSAffineTransform"""
+    if isinstance(transform, Transform):
+        return transform._matrix
+    return tuple(transform.transformStruct())
+
+# the pyobjc class-method lookup is surprisingly slow, so resolve it once rather than per call
+_new_nsxform = NSAffineTransform.transform
+
+def _ns_transform(matrix):
+    """Returns a new NSAffineTransform with the given (m11, m12, m21, m22, tX, tY) struct"""
+    xf = _new_nsxform()
+    xf.setTransformStruct_(matrix)
+    return xf
+
+_IDENTITY = (1.0, 0.0, 0.0, 1.0, 0.0, 0.0)
+
+# (cos, sin) for rotations by 0, 90, 180, and 270 degrees
+_QUARTERS = [(1.0, 0.0), (0.0, 1.0), (-1.0, 0.0), (0.0, -1.0)]
+
 class Transform(object):
+    __slots__ = ('_matrix', '_ns_cache', '_rollback', '_saved')
 
     def __init__(self, transform=None):
+        # the matrix is stored as a tuple in NSAffineTransformStruct order and composed in
+        # python. an NSAffineTransform is only created when cocoa needs one (see below)
         if transform is None:
-            transform = NSAffineTransform.transform()
-        elif isinstance(transform, Transform):
-            transform = transform._nsAffineTransform.copy()
-        elif isinstance(transform, NSAffineTransform):
-            transform = transform.copy()
+            matrix = _IDENTITY
+        elif isinstance(transform, (Transform, NSAffineTransform)):
+            matrix = _struct_of(transform)
         elif isinstance(transform, (list, tuple, NSAffineTransformStruct)):
-            struct = tuple(transform)
-            transform = NSAffineTransform.transform()
-            transform.setTransformStruct_(struct)
+            matrix = tuple(transform)
+            if len(matrix) != 6:
+                wrongsize = "Transform matrices have 6 elements (got %r)" % (transform,)
+                raise DeviceError(wrongsize)
         else:
             wrongtype = "Don't know how to handle transform %s." % transform
             raise DeviceError(wrongtype)
-        self._nsAffineTransform = transform
+        self._matrix = matrix
+        self._ns_cache = None
 
     def __enter__(self):
         # Transform objects get _rollback attrs when they're derived from the graphics
@@ -153,6 +211,10 @@ class Transform(object):
         # the global state has already been changed before the context manager was
         # invoked, so don't re-apply it again here.
         if not hasattr(self, '_rollback'):
+            # remember the context's matrix so __exit__ can restore it without inverting
+            if not hasattr(self, '_saved'):
+                self._saved = []
+            self._saved.append(_ctx._transform.matrix)
             _ctx._transform.prepend(self)
 
     def __exit__(self, type, value, tb):
@@ -166,32 +228,45 @@ class Transform(object):
             del self._rollback
             return
         else:
-            # invert our changes to restore the context's transform
-            _ctx._transform.prepend(self.inverse)
+            # restore the context's transform to its state before the block
+            _ctx._transform.matrix = self._saved.pop()
 
-    @trim_zeroes
     def __repr__(self):
-        return "%s([%.3f, %.3f, %.3f, %.3f, %.3f, %.3f])" % ((self.__class__.__name__,)
-                 + tuple(self))
+        return "%s([%s])" % (self.__class__.__name__, ", ".join(map(_num, self._matrix)))
 
     def __iter__(self):
-        for value in self._nsAffineTransform.transformStruct():
+        for value in self._matrix:
             yield value
 
     def copy(self):
         return self.__class__(self)
 
     def _get_matrix(self):
-        return self._nsAffineTransform.transformStruct()
+        return self._matrix
     def _set_matrix(self, value):
-        self._nsAffineTransform.setTransformStruct_(value)
+        self._matrix = tuple(value)
+        self._ns_cache = None
     matrix = property(_get_matrix, _set_matrix)
 
+    def _get_ns(self):
+        # build the NSAffineTransform on demand (for drawing and transforming NSBezierPaths)
+        # and reuse it until the matrix changes. treat it as read-only: modifications made
+        # to it directly won't be reflected in the Transform
+        if self._ns_cache is None:
+            self._ns_cache = _ns_transform(self._matrix)
+        return self._ns_cache
+    def _set_ns(self, xf):
+        self.matrix = _struct_of(xf)
+    _nsAffineTransform = property(_get_ns, _set_ns)
+
     @property
     def inverse(self):
-        inv = self.copy()
-        inv._nsAffineTransform.invert()
-        return inv
+        a, b, c, d, tx, ty = self._matrix
+        det = float(a*d - b*c)
+        if det == 0:
+            singular = "Transform can't be inverted (its determinant is zero): %r" % self
+            raise DeviceError(singular)
+        return self.__class__((d/det, -b/det, -c/det, a/det, (c*ty - d*tx)/det, (b*tx - a*ty)/det))
 
     def rotate(self, arg=None, **opt):
         """Prepend a rotation transform to the receiver
@@ -221,38 +296,57 @@ class Transform(object):
         if 'percent' in units:
             degrees, radians = 0, tau*units['percent']
 
-        xf = Transform()
-        if degrees:
-            xf._nsAffineTransform.rotateByDegrees_(-degrees)
+        if degrees and not degrees % 90:
+            # use exact values for right angles rather than sin/cos's near-zeroes
+            cos, sin = _QUARTERS[int(-degrees // 90) % 4]
         else:
-            xf._nsAffineTransform.rotateByRadians_(-radians)
+            if degrees:
+                radians = math.radians(degrees)
+            cos, sin = math.cos(-radians), math.sin(-radians)
+        xf = Transform((cos, sin, -sin, cos, 0, 0))
         if opt.get('rollback'):
             xf._rollback = {"_transform":self.copy()}
-        self.prepend(xf)
+        self._rotate(cos, sin)
         return xf
 
     def translate(self, x=0, y=0, **opt):
-        xf = Transform()
-        xf._nsAffineTransform.translateXBy_yBy_(x, y)
+        xf = Transform((1, 0, 0, 1, x, y))
         if opt.get('rollback'):
             xf._rollback = {"_transform":self.copy()}
-        self.prepend(xf)
+        self._translate(x, y)
         return xf
 
     def scale(self, x=1, y=None, **opt):
         if y is None:
             y = x
-        xf = Transform()
-        xf._nsAffineTransform.scaleXBy_yBy_(x, y)
+        xf = Transform((x, 0, 0, y, 0, 0))
         if opt.get('rollback'):
             xf._rollback = {"_transform":self.copy()}
-        self.prepend(xf)
+        self._scale(x, y)
         return xf
 
+    # in-place equivalents of prepending a translation, scale, or rotation (given as its
+    # cosine & sine) for internal callers that don't need the Transform returned above
+
+    def _translate(self, x, y):
+        if x or y:
+            m11, m12, m21, m22, tx, ty = self._matrix
+            self.matrix = (m11, m12, m21, m22, x*m11 + y*m21 + tx, x*m12 + y*m22 + ty)
+
+    def _scale(self, x, y):
+        if x != 1 or y != 1:
+            m11, m12, m21, m22, tx, ty = self._matrix
+            self.matrix = (x*m11, x*m12, y*m21, y*m22, tx, ty)
+
+    def _rotate(self, cos, sin):
+        if (cos, sin) != (1, 0):
+            m11, m12, m21, m22, tx, ty = self._matrix
+            self.matrix = (cos*m11 + sin*m21, cos*m12 + sin*m22,
+                           cos*m21 - sin*m11, cos*m22 - sin*m12, tx, ty)
+
     def skew(self, x=0, y=0, **opt):
-        x,y = map(_ctx._angle, [x,y]) # convert from canvas units to radians
-        xf = Transform()
-        xf.matrix = (1, math.tan(y), -math.tan(x), 1, 0, 0)
+        x, y = _ctx._angle(x), _ctx._angle(y) # convert from canvas units to radians
+        xf = Transform((1, math.tan(y), -math.tan(x), 1, 0, 0))
         if opt.get('rollback'):
             xf._rollback = {"_transform":self.copy()}
         self.prepend(xf)
@@ -264,37 +358,67 @@ class Transform(object):
     def concat(self):
         self._nsAffineTransform.concat()
 
+    # (no-op transforms like rotate(0) or translate(0,0) leave the matrix untouched)
+
     def append(self, other):
-        if isinstance(other, Transform):
-            other = other._nsAffineTransform
-        self._nsAffineTransform.appendTransform_(other)
+        other = _struct_of(other)
+        if other != _IDENTITY:
+            self.matrix = _concat(self._matrix, other)
 
     def prepend(self, other):
-        if isinstance(other, Transform):
-            other = other._nsAffineTransform
-        self._nsAffineTransform.prependTransform_(other)
+        other = _struct_of(other)
+        if other != _IDENTITY:
+            self.matrix = _concat(other, self._matrix)
 
     def apply(self, point_or_path):
-        from .bezier import Bezier
-        if isinstance(point_or_path, Bezier):
-            return self.transformBezier(point_or_path)
-        elif isinstance(point_or_path, Point):
-            return self.transformPoint(point_or_path)
-        else:
-            wrongtype = "Can only transform Beziers or Points"
-            raise DeviceError(wrongtype)
+        if not _APPLIERS:
+            _APPLIERS.update({_bezier_classes()[0]:Transform.transformBezier, Point:Transform.transformPoint})
+
+        method = _APPLIERS.get(type(point_or_path))
+        if method is None:
+            # fall back to isinstance for subclasses
+            for cls, method in _APPLIERS.items():
+                if isinstance(point_or_path, cls):
+                    break
+            else:
+                wrongtype = "Can only transform Beziers or Points"
+                raise DeviceError(wrongtype)
+        return method(self, point_or_path)
 
     def transformPoint(self, point):
-        return Point(self._nsAffineTransform.transformPoint_((point.x,point.y)))
+        m11, m12, m21, m22, tx, ty = self._matrix
+        x, y = point.x, point.y
+        return Point(m11*x + m21*y + tx, m12*x + m22*y + ty)
 
-    def transformBezier(self, path):
-        from .bezier import Bezier
-        if isinstance(path, Bezier):
-            path = path.copy()
-        else:
+    def transformPoints(self, points):
+        """Returns a list of Points with the transform applied to each of the (x,y) pairs
+
+        The matrix is only unpacked once, which is much cheaper than calling transformPoint
+        for each member of a large batch.
+        """
+        m11, m12, m21, m22, tx, ty = self._matrix
+        if (m11, m12, m21, m22) == (1, 0, 0, 1):
+            # identity or a pure translation
+            return [Point(x+tx, y+ty) for x, y in points]
+        return [Point(m11*x + m21*y + tx, m12*x + m22*y + ty) for x, y in points]
+
+    def transformBezier(self, path, in_place=False):
+        """Returns a transformed copy of a Bezier (or the Bezier itself, modified, if in_place is True)"""
+        if not isinstance(path, _bezier_classes()[0]):
             wrongtype = "Can only transform Beziers"
             raise DeviceError(wrongtype)
-        path._nsBezierPath = self._nsAffineTransform.transformBezierPath_(path._nsBezierPath)
+        if in_place:
+            # the NSBezierPath may be shared with other objects, so swap in a transformed copy
+            if self._matrix != _IDENTITY:
+                path._nsBezierPath = self._nsAffineTransform.transformBezierPath_(path._nsBezierPath)
+                path._invalidate()
+        else:
+            # the copy's NSBezierPath is private, so modify it directly rather than allocating
+            # a second, transformed one
+            path = path.copy()
+            if self._matrix != _IDENTITY:
+                path._nsBezierPath.transformUsingAffineTransform_(self._nsAffineTransform)
+                path._invalidate()
         return path
 
     def transformBezierPath(self, path):
@@ -305,6 +429,9 @@ class Transform(object):
         warnings.warn("The 'transform' attribute is deprecated. Please use _nsAffineTransform instead.", DeprecationWarning, stacklevel=2)
         return self._nsAffineTransform
 
+# the types Transform.apply() accepts and the methods that handle them (filled in on first use)
+_APPLIERS = {}
+
 ### canvas scale-factors ###
 
 class MagicNumber(object):
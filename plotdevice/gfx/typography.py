@@ -124,28 +124,28 @@ class Text(TransformMixin, EffectsMixin, BoundsMixin, StyleMixin, Grob):
         if self._transformmode == CENTER:
             width = w if self.width is None else self.width
             height = h if self.height is None else self.height
-            nudge.translate(width/2, height/2)
+            nudge._translate(width/2, height/2)
 
-            xf.translate(x, y-offset)  # set the position before applying transforms
+            xf._translate(x, y-offset) # set the position before applying transforms
             xf.prepend(nudge)          # nudge the block to its center (or not)
             xf.prepend(self.transform) # add context's CTM.
             xf.prepend(nudge.inverse)  # Move back to the real origin.
         else:
             xf.prepend(self.transform) # in CORNER mode simply apply the CTM
-            xf.translate(x, y-offset)  # then move to the baseline origin point
+            xf._translate(x, y-offset) # then move to the baseline origin point
         return xf
 
     @property
     def path(self):
         # calculate the proper transform for alignment and flippedness
         trans = Transform()
-        trans.translate(*self._screen_position)
-        trans.scale(1.0,-1.0)
+        trans._translate(*self._screen_position)
+        trans._scale(1.0,-1.0)
 
         # generate an unflipped bezier with all the glyphs
         path = Bezier(self._spool.nsBezierPath)
         path.inherit(self)
-        return trans.apply(path)
+        return trans.transformBezier(path, in_place=True)
 
     @property
     def _spool(self):
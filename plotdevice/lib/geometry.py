@@ -1,6 +1,6 @@
 # Geometric functionality
 
-from math import degrees, atan2
+from math import degrees, atan2, hypot
 from math import sqrt, pow
 from math import radians, sin, cos
 
@@ -29,6 +29,14 @@ except ImportError:
         y1 = y0 + sin(radians(angle)) * distance
         return x1, y1
 
+# batch versions (for measuring from one point to many without a call per pair)
+
+def distances(x0, y0, points):
+    return [hypot(x1-x0, y1-y0) for x1, y1 in points]
+
+def angles(x0, y0, points):
+    return [degrees(atan2(y1-y0, x1-x0)) for x1, y1 in points]
+
 def reflect(x0, y0, x1, y1, d=1.0, a=180):
     d *= distance(x0, y0, x1, y1)
     a += angle(x0, y0, x1, y1)
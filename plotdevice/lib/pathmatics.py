@@ -1,5 +1,5 @@
-__all__ = ('linepoint', 'linelength', 'curvepoint', 'curvelength', 'segment_lengths',
-           'length', 'point', 'points', 'contours', 'findpath', 'insert_point')
+__all__ = ('linepoint', 'linelength', 'curvepoint', 'curvelength', 'cgpath', 'elements', 'segment_lengths',
+           'coefficients', 'segment_offsets', 'arclength_table', 'length', 'point', 'points', 'contours', 'findpath', 'insert_point')
 from cPathmatics import intersects, union, intersect, difference, xor
 
 try:
@@ -104,6 +104,49 @@ except ImportError:
 
         return length
 
+try:
+    # build the CGPath with a single call into the extension rather than one per element
+    from cPathmatics import cgpath as _cgpath, cfrelease as _cfrelease
+    from objc import objc_object
+
+    def cgpath(nspath):
+        """Returns an immutable CGPath with the same elements as the NSBezierPath."""
+        # the extension hands over its +1 reference, which is dropped once the proxy retains it
+        ref = _cgpath(nspath)
+        try:
+            return objc_object(c_void_p=ref)
+        finally:
+            _cfrelease(ref)
+except ImportError:
+    from Quartz import CGPathCreateMutable, CGPathCreateCopy, CGPathMoveToPoint, \
+                       CGPathAddLineToPoint, CGPathAddCurveToPoint, CGPathCloseSubpath
+    from Quartz import NSMoveToBezierPathElement, NSLineToBezierPathElement, \
+                       NSCurveToBezierPathElement, NSClosePathBezierPathElement
+
+    def cgpath(nspath):
+        """Returns an immutable CGPath with the same elements as the NSBezierPath."""
+        eai = nspath.elementAtIndex_associatedPoints_
+        cg = CGPathCreateMutable()
+        for cmd, points in (eai(i) for i in xrange(nspath.elementCount())):
+            if cmd==NSMoveToBezierPathElement:
+                CGPathMoveToPoint(cg, None, points[0].x, points[0].y)
+            elif cmd==NSLineToBezierPathElement:
+                CGPathAddLineToPoint(cg, None, points[0].x, points[0].y)
+            elif cmd==NSCurveToBezierPathElement:
+                CGPathAddCurveToPoint(cg, None, points[0].x, points[0].y,
+                                                points[1].x, points[1].y,
+                                                points[2].x, points[2].y)
+            elif cmd==NSClosePathBezierPathElement:
+                CGPathCloseSubpath(cg)
+        return CGPathCreateCopy(cg)
+
+try:
+    from cPathmatics import elements
+except ImportError:
+    def elements(nspath):
+        """Returns a tuple of (cmd, points) pairs for every element in the NSBezierPath."""
+        eai = nspath.elementAtIndex_associatedPoints_
+        return tuple(eai(i) for i in xrange(nspath.elementCount()))
 
 
 # Bezier - last updated for PlotDevice 1.8.3
@@ -112,13 +155,75 @@ except ImportError:
 # Copyright (c) 2007 by Tom De Smedt.
 # Refer to the "Use" section on http://nodebox.net/code
 # Thanks to Dr. Florimond De Smedt at the Free University of Brussels for the math routines.
+from math import hypot
+from bisect import bisect_left
 from plotdevice import DeviceError
 from Quartz import NSMoveToBezierPathElement as MOVETO, NSLineToBezierPathElement as LINETO
 from Quartz import NSCurveToBezierPathElement as CURVETO, NSClosePathBezierPathElement as CLOSE
 
-def segment_lengths(path, relative=False, n=20):
+try:
+    from cPathmatics import segment_lengths as _segment_lengths
+except ImportError:
+    FLATNESS, MAX_DEPTH = 0.01, 10
+
+    def _curvelength_adaptive(x0, y0, x1, y1, x2, y2, x3, y3):
+        """Returns the length of the spline, subdividing until each piece is nearly flat."""
+        length = 0.0
+        stack = [(x0, y0, x1, y1, x2, y2, x3, y3, 0)]
+        while stack:
+            x0, y0, x1, y1, x2, y2, x3, y3, depth = stack.pop()
+            chord = hypot(x3-x0, y3-y0)
+            poly = hypot(x1-x0, y1-y0) + hypot(x2-x1, y2-y1) + hypot(x3-x2, y3-y2)
+            if poly-chord < FLATNESS or depth >= MAX_DEPTH:
+                length += (chord + poly) / 2
+                continue
+
+            # split at t=0.5 (de casteljau) and measure each half
+            x01, y01 = (x0+x1)/2, (y0+y1)/2
+            x12, y12 = (x1+x2)/2, (y1+y2)/2
+            x23, y23 = (x2+x3)/2, (y2+y3)/2
+            x012, y012 = (x01+x12)/2, (y01+y12)/2
+            x123, y123 = (x12+x23)/2, (y12+y23)/2
+            xm, ym = (x012+x123)/2, (y012+y123)/2
+            stack.append((xm, ym, x123, y123, x23, y23, x3, y3, depth+1))
+            stack.append((x0, y0, x01, y01, x012, y012, xm, ym, depth+1))
+        return length
+
+    def _segment_lengths(nspath, n=20):
+        """Returns a list with the length of each segment in the NSBezierPath.
+
+        Curves are measured with n line segments (or by adaptive subdivision if n is 0)."""
+        lengths = []
+        for i, (cmd, pts) in enumerate(elements(nspath)):
+            x, y = pts[2] if cmd==CURVETO else pts[0] if cmd!=CLOSE else (0.0, 0.0)
+            if i == 0:
+                close_x, close_y = x, y
+            elif cmd == MOVETO:
+                close_x, close_y = x, y
+                lengths.append(0.0)
+            elif cmd == CLOSE:
+                lengths.append(linelength(x0, y0, close_x, close_y))
+            elif cmd == LINETO:
+                lengths.append(linelength(x0, y0, x, y))
+            elif cmd == CURVETO:
+                (x1, y1), (x2, y2) = pts[:2]
+                if n > 0:
+                    lengths.append(curvelength(x0, y0, x1, y1, x2, y2, x, y, n))
+                else:
+                    lengths.append(_curvelength_adaptive(x0, y0, x1, y1, x2, y2, x, y))
+
+            if cmd != CLOSE:
+                x0, y0 = x, y
+        return lengths
+
+def segment_lengths(path, relative=False, n=None):
     """Returns a list with the lengths of each segment in the path.
 
+    Curves are measured by summing the lengths of n chords or, if n is omitted, by
+    adaptively subdividing them (which is both faster on nearly-straight curves and
+    more accurate on sharp ones). Relative lengths default to the 20-chord estimate
+    since point() and points() use them to map t onto the segments.
+
     >>> path = Bezier(None)
     >>> segment_lengths(path)
     []
@@ -140,28 +245,9 @@ def segment_lengths(path, relative=False, n=20):
     [8.4852813742385695]
     """
 
-    lengths = []
-    first = True
-
-    for el in path:
-        if first == True:
-            close_x, close_y = el.x, el.y
-            first = False
-        elif el.cmd == MOVETO:
-            close_x, close_y = el.x, el.y
-            lengths.append(0.0)
-        elif el.cmd == CLOSE:
-            lengths.append(linelength(x0, y0, close_x, close_y))
-        elif el.cmd == LINETO:
-            lengths.append(linelength(x0, y0, el.x, el.y))
-        elif el.cmd == CURVETO:
-            x3, y3, x1, y1, x2, y2 = el.x, el.y, el.ctrl1.x, el.ctrl1.y, el.ctrl2.x, el.ctrl2.y
-            lengths.append(curvelength(x0, y0, x1, y1, x2, y2, x3, y3, n))
-
-        if el.cmd != CLOSE:
-            x0 = el.x
-            y0 = el.y
-
+    if n is None:
+        n = 20 if relative else 0
+    lengths = _segment_lengths(path._nsBezierPath, n)
     if relative:
         length = sum(lengths)
         try:
@@ -171,12 +257,13 @@ def segment_lengths(path, relative=False, n=20):
     else:
         return lengths
 
-def length(path, segmented=False, n=20):
+def length(path, segmented=False, n=None):
 
     """Returns the length of the path.
 
     Calculates the length of each spline in the path,
-    using n as a number of points to measure.
+    using n as a number of points to measure (or adaptive
+    subdivision if n is omitted).
 
     When segmented is True, returns a list
     containing the individual length of each spline
@@ -208,6 +295,196 @@ def length(path, segmented=False, n=20):
     else:
         return segment_lengths(path, relative=True, n=n)
 
+def _cubic(p0, p1, p2, p3):
+    # power-basis terms of a cubic bezier (ordered for horner evaluation)
+    return (3*(p1-p2) + p3 - p0, 3*(p0 - 2*p1 + p2), 3*(p1-p0), p0)
+
+def _quadratic(p0, p1, p2):
+    return (p0 - 2*p1 + p2, 2*(p1-p0), p0)
+
+def coefficients(path):
+
+    """Returns the power-basis coefficients of each segment in the path.
+
+    Each segment is described by a (cmd, xs, ys, handles) tuple where xs and
+    ys are the (a, b, c, d) terms of the polynomial a*t^3 + b*t^2 + c*t + d.
+    Lines (including the closing line of a CLOSE) are promoted to cubics with
+    evenly spaced control points, which leaves only the linear terms. For curves,
+    `handles' holds the quadratic terms of the two control points produced by
+    splitting the curve at t (as returned by curvepoint), otherwise it's None.
+
+    The list lines up with the one returned by segment_lengths().
+
+    >>> path = Bezier(None)
+    >>> path.moveto(0, 0)
+    >>> path.lineto(100, 50)
+    >>> coefficients(path)
+    [(1, (0.0, 0.0, 100.0, 0.0), (0.0, 0.0, 50.0, 0.0), None)]
+    """
+
+    coeffs = []
+    first = True
+
+    for el in path:
+        if first == True:
+            close_x, close_y = el.x, el.y
+            first = False
+        elif el.cmd == MOVETO:
+            close_x, close_y = el.x, el.y
+            coeffs.append((LINETO, (0.0, 0.0, 0.0, el.x), (0.0, 0.0, 0.0, el.y), None))
+        elif el.cmd in (LINETO, CLOSE):
+            x1, y1 = (close_x, close_y) if el.cmd == CLOSE else (el.x, el.y)
+            coeffs.append((LINETO, (0.0, 0.0, x1-x0, x0), (0.0, 0.0, y1-y0, y0), None))
+        elif el.cmd == CURVETO:
+            x3, y3, x1, y1, x2, y2 = el.x, el.y, el.ctrl1.x, el.ctrl1.y, el.ctrl2.x, el.ctrl2.y
+            handles = (_quadratic(x0, x1, x2), _quadratic(y0, y1, y2),
+                       _quadratic(x1, x2, x3), _quadratic(y1, y2, y3))
+            coeffs.append((CURVETO, _cubic(x0, x1, x2, x3), _cubic(y0, y1, y2, y3), handles))
+
+        if el.cmd == CLOSE:
+            x0, y0 = close_x, close_y
+        else:
+            x0, y0 = el.x, el.y
+
+    return coeffs
+
+def segment_offsets(segments):
+
+    """Returns the running totals of a list of segment lengths.
+
+    The result is a (totals, last) tuple where `last' is the index of the
+    final non-empty segment. Together with the lengths themselves they're
+    used to find the segment containing a given t with a binary search.
+
+    >>> segment_offsets([0.25, 0.75, 0.0])
+    ([0.25, 1.0, 1.0], 1)
+    """
+
+    totals, total = [], 0.0
+    for l in segments:
+        total += l
+        totals.append(total)
+
+    # don't let trailing zero-length segments (e.g., a final moveto) swallow t=1.0
+    last = len(segments)-1
+    while last > 0 and not segments[last]:
+        last -= 1
+    return totals, last
+
+def arclength_table(coeffs, flatness=0.01):
+
+    """Returns a table mapping distances along the path to (segment, t) pairs.
+
+    The result is a (lengths, segs, ts) tuple of parallel lists where lengths[k]
+    is the distance from the start of the path to the point at ts[k] on segment
+    segs[k] (indexed as in coeffs, the list returned by coefficients()). Lines
+    only need their endpoints while curves are refined adaptively, splitting a
+    t-interval until its chord is within `flatness' of the two halves' chords
+    and the halves are nearly equal in length.
+    Used by points() to space its samples evenly along the path.
+
+    >>> path = Bezier(None)
+    >>> path.moveto(0, 0)
+    >>> path.lineto(100, 0)
+    >>> arclength_table(coefficients(path))
+    ([0.0, 100.0], [0, 0], [0.0, 1.0])
+    """
+
+    lengths, segs, ts = [], [], []
+    total = 0.0
+    for i, (cmd, xs, ys, handles) in enumerate(coeffs):
+        lengths.append(total)
+        segs.append(i)
+        ts.append(0.0)
+        if cmd != CURVETO:
+            total += hypot(xs[2], ys[2])
+            lengths.append(total)
+            segs.append(i)
+            ts.append(1.0)
+            continue
+
+        # walk the intervals depth-first so the nodes are emitted in order of t (and
+        # split at least twice so an s-curve's midpoint can't land on the chord)
+        stack = [(0.0, 1.0, (xs[3], ys[3]), (sum(xs), sum(ys)), 0)]
+        while stack:
+            t0, t1, (x0, y0), (x1, y1), depth = stack.pop()
+            tm = (t0 + t1) / 2
+            xm, ym = _horner(xs, tm), _horner(ys, tm)
+            d0, d1 = hypot(xm-x0, ym-y0), hypot(x1-xm, y1-ym)
+
+            # stop once the interval is flat *and* its halves are about the same length
+            # (otherwise arc length isn't close enough to linear in t for _seek_length
+            # to interpolate within it)
+            flat = d0 + d1 - hypot(x1-x0, y1-y0) < flatness
+            if depth >= 10 or (depth >= 2 and flat and abs(d0 - d1) < flatness*10):
+                total += d0 + d1
+                lengths.append(total)
+                segs.append(i)
+                ts.append(t1)
+            else:
+                stack.append((tm, t1, (xm, ym), (x1, y1), depth+1))
+                stack.append((t0, tm, (x0, y0), (xm, ym), depth+1))
+
+    return lengths, segs, ts
+
+def _horner(terms, t):
+    a, b, c, d = terms
+    return ((a*t + b)*t + c)*t + d
+
+def _seek(segments, offsets, t):
+    """Returns the index of the segment containing t and the t value within that segment"""
+    totals, last = offsets
+    i = min(bisect_left(totals, t), last)
+    try:
+        t = (t - totals[i] + segments[i]) / segments[i]
+    except ZeroDivisionError:
+        t = 0.0
+    return i, t
+
+def _seek_length(table, s):
+    """Returns the index of the segment that is distance s along the path and the t value within it"""
+    lengths, segs, ts = table
+    k = bisect_left(lengths, s)
+    if k == 0:
+        return segs[0], ts[0]
+    elif k == len(lengths):
+        return segs[-1], ts[-1]
+    elif segs[k] != segs[k-1] or lengths[k] == lengths[k-1]:
+        return segs[k], ts[k]
+
+    # interpolate between the neighbouring nodes (which are close enough to treat as a line)
+    f = (s - lengths[k-1]) / (lengths[k] - lengths[k-1])
+    return segs[k], ts[k-1] + f * (ts[k] - ts[k-1])
+
+_Bezier = _Curve = None
+
+def _bezier_classes():
+    """Returns the (Bezier, Curve) classes, importing them on first use.
+
+    The bezier module imports this one (as does transform), so the lookup can't happen at
+    import time but shouldn't run the import machinery on every call either.
+    """
+    global _Bezier, _Curve
+    if _Bezier is None:
+        from ..gfx.bezier import Bezier, Curve
+        _Bezier, _Curve = Bezier, Curve
+    return _Bezier, _Curve
+
+def _evaluate(segment, t):
+    """Returns a Curve for the point at t on a segment from coefficients()"""
+    Curve = _Curve or _bezier_classes()[1]
+
+    cmd, (ax, bx, cx, dx), (ay, by, cy, dy), handles = segment
+    x = ((ax*t + bx)*t + cx)*t + dx
+    y = ((ay*t + by)*t + cy)*t + dy
+    if handles is None:
+        return Curve(LINETO, ((x, y),))
+
+    (ax1, bx1, cx1), (ay1, by1, cy1), (ax2, bx2, cx2), (ay2, by2, cy2) = handles
+    c1 = ((ax1*t + bx1)*t + cx1, (ay1*t + by1)*t + cy1)
+    c2 = ((ax2*t + bx2)*t + cx2, (ay2*t + by2)*t + cy2)
+    return Curve(CURVETO, (c1, c2, (x, y)))
+
 def _locate(path, t, segments=None):
 
     """Locates t on a specific segment in the path.
@@ -267,7 +544,7 @@ def _locate(path, t, segments=None):
 
     return (i, t, closeto)
 
-def point(path, t, segments=None):
+def point(path, t, segments=None, coeffs=None, offsets=None):
 
     """Returns coordinates for point at t on the path.
 
@@ -282,7 +559,8 @@ def point(path, t, segments=None):
     since it doesn't need to recalculate the length
     during each iteration. Note that this has been deprecated:
     the Bezier now caches the segment lengths the moment you use
-    them.
+    them (along with the coefficients and offsets used to find
+    and evaluate the segment with a binary search).
 
     >>> path = Bezier(None)
     >>> point(path, 0.0)
@@ -300,35 +578,33 @@ def point(path, t, segments=None):
     >>> point(path, 0.1)
     Curve(LINETO, ((10.0, 0.0),))
     """
-    from ..gfx.bezier import Curve
-
     if len(path) == 0:
         raise DeviceError, "The given path is empty"
 
-    i, t, closeto = _locate(path, t, segments=segments)
-
-    x0, y0 = path[i].x, path[i].y
-    p1 = path[i+1]
+    if segments is None:
+        segments = path.segmentlengths(relative=True)
+    if len(segments) == 0:
+        raise DeviceError, "The given path is empty"
+    if coeffs is None:
+        coeffs = coefficients(path)
+    if offsets is None:
+        offsets = segment_offsets(segments)
 
-    if p1.cmd == CLOSE:
-        x, y = linepoint(t, x0, y0, closeto.x, closeto.y)
-        return Curve(LINETO, ((x, y),))
-    elif p1.cmd == LINETO:
-        x1, y1 = p1.x, p1.y
-        x, y = linepoint(t, x0, y0, x1, y1)
-        return Curve(LINETO, ((x, y),))
-    elif p1.cmd == CURVETO:
-        x3, y3, x1, y1, x2, y2 = p1.x, p1.y, p1.ctrl1.x, p1.ctrl1.y, p1.ctrl2.x, p1.ctrl2.y
-        x, y, c1x, c1y, c2x, c2y = curvepoint(t, x0, y0, x1, y1, x2, y2, x3, y3)
-        return Curve(CURVETO, ((c1x, c1y), (c2x, c2y), (x, y)))
-    else:
-        raise DeviceError, "Unknown cmd for p1 %s" % p1
+    i, t = _seek(segments, offsets, t)
+    return _evaluate(coeffs[i], t)
 
-def points(path, amount=100):
+def points(path, amount=100, even=False, segments=None, coeffs=None, offsets=None, table=None):
     """Returns an iterator with a list of calculated points for the path.
-    This method calls the point method <amount> times, increasing t,
+    This method evaluates the path <amount> times, increasing t,
     distributing point spacing linearly.
 
+    Within a curve, equal steps in t don't cover equal distances. If even is
+    True the points are instead placed at equal distances along the path by
+    way of an arclength_table().
+
+    The segment lengths, coefficients, offsets, and table are only computed
+    once for the whole batch (or can be passed in if the caller has them cached).
+
     >>> path = Bezier(None)
     >>> list(points(path))
     Traceback (most recent call last):
@@ -342,6 +618,13 @@ def points(path, amount=100):
     >>> path.lineto(100, 0)
     >>> list(points(path, amount=4))
     [Curve(LINETO, ((0.0, 0.0),)), Curve(LINETO, ((25.0, 0.0),)), Curve(LINETO, ((50.0, 0.0),)), Curve(LINETO, ((75.0, 0.0),))]
+    >>> path = Bezier(None)
+    >>> path.moveto(0, 0)
+    >>> path.curveto(0, 300, 10, 300, 400, 0)
+    >>> pts = list(points(path, amount=32, even=True))
+    >>> gaps = [hypot(b.x-a.x, b.y-a.y) for a, b in zip(pts, pts[1:])]
+    >>> min(gaps) / max(gaps) > 0.98
+    True
     """
 
     if len(path) == 0:
@@ -356,8 +639,27 @@ def points(path, amount=100):
     except ZeroDivisionError:
         delta = 1.0
 
-    for i in xrange(amount):
-        yield point(path, delta*i)
+    if segments is None:
+        segments = path.segmentlengths(relative=True)
+    if len(segments) == 0:
+        raise DeviceError, "The given path is empty"
+    if coeffs is None:
+        coeffs = coefficients(path)
+    if even:
+        if table is None:
+            table = arclength_table(coeffs)
+        total = table[0][-1]
+        for n in xrange(amount):
+            i, t = _seek_length(table, total*delta*n)
+            yield _evaluate(coeffs[i], t)
+        return
+
+    if offsets is None:
+        offsets = segment_offsets(segments)
+
+    for n in xrange(amount):
+        i, t = _seek(segments, offsets, delta*n)
+        yield _evaluate(coeffs[i], t)
 
 def contours(path):
     """Returns a list of contours in the path.
@@ -171,8 +171,14 @@ def _flatten(seq):
 
 ### repr decorator (tidies numbers) ###
 
+_TRIM_RE = re.compile(r'\.?0+(?=[,\)\]])')
+
+def _trim(s):
+    """Strips the trailing zeroes (and bare decimal points) from the numbers in a repr string"""
+    return _TRIM_RE.sub('', s)
+
 def trim_zeroes(func):
-    return lambda slf: re.sub(r'\.?0+(?=[,\)\]])', '', func(slf))
+    return lambda slf: _trim(func(slf))
 
 ### Dimension-aware number detector (replacement for isintance) ###
 